@@ -0,0 +1,23 @@
+"""
+One-shot utility: convert the project CSV datasets to Parquet.
+
+project.py loads a dataset's Parquet copy, with the column types from
+DATASET_SCHEMAS, whenever it is newer than the CSV; an edited CSV is
+read directly until this script is re-run. Requires pyarrow.
+"""
+
+import pandas as pd
+
+from project import DATASET_SCHEMAS, _parquet_path
+
+
+def main():
+    for path, schema in DATASET_SCHEMAS.items():
+        df = pd.read_csv(path, dtype=schema)
+        out = _parquet_path(path)
+        df.to_parquet(out, index=False)
+        print(f"{path} -> {out} ({len(df)} rows)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,34 @@
+import bisect
+import os
+import re
+import sys
+import unicodedata
+from functools import lru_cache
+from numbers import Integral, Real
+from types import MappingProxyType
+
+import numpy as np
 import pandas as pd
-from tabulate import tabulate
+
 
 
 # ======================================================
 # CLIMATE & ENVIRONMENTAL RISK ASSESSMENT
 # ======================================================
+
+# Fixed month order for rainfall window calculations
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+_MONTH_IDX = {name: i for i, name in enumerate(_MONTHS)}
+
+def _month_index(planting_month):
+    """Position of the planting month in the calendar (0 = January)."""
+    if planting_month not in _MONTH_IDX:
+        raise ValueError(f"Unknown planting month '{planting_month}'.")
+    return _MONTH_IDX[planting_month]
+
 def climate_class_from_rainfall(climate_df, state, planting_month, months_order):
     """
     Classify climate suitability based on cumulative rainfall
@@ -14,106 +38,299 @@ def climate_class_from_rainfall(climate_df, state, planting_month, months_order)
     start_idx = months_order.index(planting_month)
     months = [months_order[(start_idx + i) % 12] for i in range(3)]
     
-    # Aggregate rainfall over the selected window
+    # Aggregate rainfall over the selected window (month labels are
+    # stripped, as some CSV cells carry trailing spaces)
     rainfall_sum = climate_df[
         (climate_df["state"] == state) &
-        (climate_df["month"].isin(months))
+        (climate_df["month"].str.strip().isin(months))
     ]["avg_rainfall_mm"].sum()
 
-    # Rule-based classification
-    if rainfall_sum < 100:
-        return "Low"
-    elif rainfall_sum < 200:
-        return "Medium"
-    return "High"
+    return classify_rainfall(rainfall_sum)
+
+# Climate classes by 100 mm rainfall band (<100, <200, >=200)
+_CLIMATE_CLASSES = ("Low", "Medium", "High")
+_RAINFALL_BANDS = (100, 200)
+
+def classify_rainfall(rainfall_sum):
+    """ Map a 3-month cumulative rainfall total (mm) to a climate class."""
+    # Rule-based classification (same band rule as np.digitize in
+    # MaizeAdvisorySystem.__init__)
+    return _CLIMATE_CLASSES[bisect.bisect_right(_RAINFALL_BANDS, rainfall_sum)]
 
+# Climate class -> (drought risk, irrigation advice)
+_DROUGHT = {
+    "low": ("High", "Frequent irrigation required"),
+    "medium": ("Medium", "Moderate irrigation recommended"),
+    "high": ("Low", "Irrigation usually not required"),
+}
+
+@lru_cache(maxsize=8)
 def drought_risk_from_climate(climate_class):
     """ Infer drought risk and irrigation advice from climate class."""
-    c = climate_class.lower()
-    if c == "low":
-        return "High", "Frequent irrigation required"
-    elif c == "medium":
-        return "Medium", "Moderate irrigation recommended"
-    elif c == "high":
-        return "Low", "Irrigation usually not required"
-    return "Unknown", "Unknown"
+    return _DROUGHT.get(climate_class.lower(), ("Unknown", "Unknown"))
 
 # ======================================================
 # SOIL FERTILITY & INPUT RECOMMENDATIONS
 # ======================================================
 
+# Soil fertility level -> soil fertility risk
+_SOIL_RISK = {"low": "High", "medium": "Medium", "high": "Low"}
+
+@lru_cache(maxsize=8)
 def soil_fertility_risk(soil_level):
     """ Translate soil fertility level into a risk category """
-    s = soil_level.lower()
-    if s == "low":
-        return "High"
-    elif s == "medium":
-        return "Medium"
-    elif s == "high":
-        return "Low"
-    return "Unknown"
-
+    return _SOIL_RISK.get(soil_level.lower(), "Unknown")
+
+# Soil fertility level -> fertilizer rates (kg/ha); read-only so the
+# shared recommendations cannot be mutated by callers
+_FERTILIZER = {
+    "low": MappingProxyType({"N": 120, "P2O5": 60, "K2O": 60,
+            "notes":"Basal NPK 15-15-15 at 400 kg/ha + Urea top-dress at 125 kg/ha and MOP 100 kg/ha recommended.\n"
+            "Split N: half at planting, half 4–6 weeks later."}),
+    "medium": MappingProxyType({"N": 60, "P2O5": 30, "K2O": 30,
+            "notes":"NPK 15-15-15 at moderate levels required + Split Urea fertilizer application"}),
+    "high": MappingProxyType({"N": 30, "P2O5": 0, "K2O": 0,
+            "notes":"Minimal fertilizer (only urea) input required."}),
+}
+_NO_FERTILIZER = MappingProxyType({"N": 0, "P2O5": 0, "K2O": 0, "notes": "No recommendation"})
+
+@lru_cache(maxsize=8)
 def recommend_fertilizer(soil_level):
     """ Provide fertilizer recommendations based on soil fertility """
-    s = soil_level.lower()
-    if s == "low":
-        return {"N": 120, "P2O5": 60, "K2O": 60,
-                "notes":"Basal NPK 15-15-15 at 400 kg/ha + Urea top-dress at 125 kg/ha and MOP 100 kg/ha recommended.\n"
-                "Split N: half at planting, half 4–6 weeks later."}
-    elif s == "medium":
-        return {"N": 60, "P2O5": 30, "K2O": 30,
-                "notes":"NPK 15-15-15 at moderate levels required + Split Urea fertilizer application"}
-    elif s == "high":
-        return {"N": 30, "P2O5": 0, "K2O": 0,
-                "notes":"Minimal fertilizer (only urea) input required."}
-    return {"N": 0, "P2O5": 0, "K2O": 0, "notes": "No recommendation"}
+    return _recommend_fertilizer_lc(soil_level.lower())
+
+def _recommend_fertilizer_lc(soil_lc):
+    """recommend_fertilizer for an already-lowercased soil level."""
+    return _FERTILIZER.get(soil_lc, _NO_FERTILIZER)
 
 
 # ======================================================
 # PEST & DISEASE RISK ASSESSMENT
 # ======================================================
 
+# Risk levels in increasing severity; a risk's code is its position
+_RISK_LEVELS = ("Low", "Medium", "High")
+_RISK_CODE = {level: i for i, level in enumerate(_RISK_LEVELS)}
+
 def pest_disease_risk(drought_risk, soil_risk):
     """Combine drought and soil risks to estimate pest/disease pressure (risk)"""
-    if drought_risk == "High" or soil_risk == "High":
-        return "High"
-    elif drought_risk == "Medium" or soil_risk == "Medium":
-        return "Medium"
-    return "Low"
+    # The more severe of the two risks wins; unknown levels count as Low
+    return _RISK_LEVELS[max(_RISK_CODE.get(drought_risk, 0),
+                            _RISK_CODE.get(soil_risk, 0))]
 
 
+# Pest/disease risk level -> management advice
+_PEST_NOTE = {
+    "high": "Intensive monitoring and timely pesticide application recommended.",
+    "medium": "Regular monitoring with targeted interventions if needed.",
+}
+
+@lru_cache(maxsize=8)
 def pest_disease_recommendation(risk_level: str) -> str:
     """ Provide pest and disease management advice based on risk level."""
-    r = risk_level.lower()
-    if r == "high":
-        return "Intensive monitoring and timely pesticide application recommended."
-    elif r == "medium":
-        return "Regular monitoring with targeted interventions if needed."
-    return "Routine monitoring sufficient."
+    return _PEST_NOTE.get(risk_level.lower(), "Routine monitoring sufficient.")
 
 # ======================================================
 # RISK FORMATTING & CLASSIFICATION
 # ======================================================
 
+# Risk level -> ANSI color-coded console label
+_COLOR = {
+    "high": "\033[91m🔴 High\033[0m",
+    "medium": "\033[93m🟡 Medium\033[0m",
+    "low": "\033[92m🟢 Low\033[0m",
+}
+
+@lru_cache(maxsize=8)
 def color_risk(risk: str) -> str:
     """
     Convert risk level into a color-coded string
     for improved readability in console output.
 
     """
-    r = risk.lower()
-    if r == "high":
-        return "\033[91m🔴 High\033[0m"
-    elif r == "medium":
-        return "\033[93m🟡 Medium\033[0m"
-    elif r == "low":
-        return "\033[92m🟢 Low\033[0m"
-    return "Unknown"
+    return _COLOR.get(risk.lower(), "Unknown")
+
+# ======================================================
+# REPORT TABLE RENDERING
+# ======================================================
+
+# fancy_grid border pieces: (left, fill, column separator, right)
+_TOP = ("╒", "═", "╤", "╕")
+_HEAD = ("╞", "═", "╪", "╡")
+_MID = ("├", "─", "┼", "┤")
+_BOT = ("╘", "═", "╧", "╛")
+
+# ANSI color codes take no space on screen (see color_risk)
+_ANSI = re.compile(r"\x1b\[[0-9;]*m")
+
+
+def _display_width(text):
+    """Terminal column width of text: ANSI codes are invisible, emoji are wide."""
+    return sum(
+        2 if unicodedata.east_asian_width(ch) in "WF" else 1
+        for ch in _ANSI.sub("", text)
+    )
+
+# Fixed row labels of each report table, and the label column widths
+# derived from them (header labels get tabulate's 2-space min padding)
+_SUMMARY_LABELS = ("State", "Agro-ecological zone", "Planting month",
+                   "Soil fertility", "Climate class")
+_RISK_LABELS = ("Drought risk", "Soil fertility risk", "Pest/Disease risk")
+_FERT_LABELS = ("N", "P2O5", "K2O")
+_VARIETY_LABELS = ("Name", "Maturity group", "Drought tolerance",
+                   "Low-N tolerance", "Yield potential (t/ha)", "Grain type")
+
+_SUMMARY_W = max(map(len, _SUMMARY_LABELS))
+_RISK_W = max(max(map(len, _RISK_LABELS)), len("Risk") + 2)
+_FERT_W = max(max(map(len, _FERT_LABELS)), len("Nutrient") + 2)
+_VARIETY_W = max(map(len, _VARIETY_LABELS))
+
+# maize_df columns shown in the variety table, in _VARIETY_LABELS order
+_VARIETY_COLUMNS = ["variety_name", "maturity_group", "drought_tolerance",
+                    "low_n_tolerance", "yield_potential", "grain_type"]
+
+
+def _border(parts, w1, w2):
+    """Build one horizontal fancy_grid border line for two columns."""
+    left, fill, sep, right = parts
+    return f"{left}{fill * (w1 + 2)}{sep}{fill * (w2 + 2)}{right}"
+
+
+def _render_kv(rows, key_width, headers=None):
+    """
+    Render two-column rows as a fancy_grid table, matching tabulate's
+    output for the report tables. Only the value column width is
+    measured; the label column width is precomputed by the caller.
+
+    All-integer value columns are right-aligned; columns needing
+    tabulate's decimal-point alignment are left to tabulate (see _table).
+    """
+    values = [str(v).strip() for _, v in rows]
+    widths = [_display_width(v) for v in values]
+
+    # tabulate right-aligns all-integer columns and left-aligns text
+    numeric = all(isinstance(v, Integral) for _, v in rows)
+
+    w2 = max(widths)
+    if headers:
+        w2 = max(w2, len(headers[1]) + 2)
+
+    def line(key, value, width):
+        pad = " " * (w2 - width)
+        cell = pad + value if numeric else value + pad
+        return f"│ {key:<{key_width}} │ {cell} │"
+
+    out = [_border(_TOP, key_width, w2)]
+    if headers:
+        out.append(line(headers[0], headers[1], len(headers[1])))
+        out.append(_border(_HEAD, key_width, w2))
+    for i, ((key, _), value, width) in enumerate(zip(rows, values, widths)):
+        if i:
+            out.append(_border(_MID, key_width, w2))
+        out.append(line(key, value, width))
+    out.append(_border(_BOT, key_width, w2))
+    return "\n".join(out)
+
+
+def _table(rows, key_width, headers=None, tablefmt="fancy_grid"):
+    """
+    Render a two-column report table. fancy_grid, the report default,
+    is rendered by _render_kv; any other format, or a numeric column
+    with non-integer values (decimal-aligned), is passed to tabulate.
+    """
+    values = [v for _, v in rows]
+    decimal = (all(isinstance(v, Real) for v in values)
+               and not all(isinstance(v, Integral) for v in values))
+    if tablefmt == "fancy_grid" and not decimal:
+        return _render_kv(rows, key_width, headers)
+
+    # Imported on first use so the default report never loads tabulate
+    from tabulate import tabulate
+    return tabulate(rows, headers=headers or (), tablefmt=tablefmt)
 
 # ======================================================
 # MAIZE ADVISORY SYSTEM CLASS
 # ======================================================
 
+# Ordered tolerance levels; a variety passes a risk filter when its
+# tolerance is at least the minimum required for that risk
+_TOLERANCE = pd.CategoricalDtype(["low", "medium", "high"], ordered=True)
+_MIN_TOLERANCE = {"High": "high", "Medium": "medium"}
+
+# Batch assessment: input columns, and level names indexed by risk
+# code (0 = Low, 1 = Medium, 2 = High; -1 picks "Unknown")
+_INPUT_COLUMNS = ["state", "planting_month", "soil_level"]
+_LEVEL_NAMES = np.array(_RISK_LEVELS + ("Unknown",))
+_SOIL_RISK_CODE = {lv: _RISK_CODE[risk] for lv, risk in _SOIL_RISK.items()}
+_IRRIGATION_NOTES = np.array([_DROUGHT[c.lower()][1] for c in _CLIMATE_CLASSES])
+
+
+def _classify_batch_numpy(climate12, state_idx, month_idx, soil_code):
+    """
+    Classify a batch of requests from the state x planting-month climate
+    code matrix (see MaizeAdvisorySystem.__init__).
+
+    Returns int8 climate, drought and pest risk codes; soil_code holds
+    the soil fertility risk code of each request (-1 if unknown).
+    """
+    climate = climate12[state_idx, month_idx]
+    drought = 2 - climate
+    pest = np.maximum(drought, soil_code)
+    return climate, drought, pest
+
+
+def _make_classify_batch_loop(prange):
+    """
+    Build a per-row version of _classify_batch_numpy that iterates with
+    the given loop range: numba.prange for the compiled Numba kernel,
+    range for plain Python.
+    """
+    def loop(climate12, state_idx, month_idx, soil_code):
+        n = state_idx.shape[0]
+        climate = np.empty(n, np.int8)
+        drought = np.empty(n, np.int8)
+        pest = np.empty(n, np.int8)
+        for i in prange(n):
+            c = climate12[state_idx[i], month_idx[i]]
+            climate[i] = c
+            drought[i] = 2 - c
+            pest[i] = max(2 - c, soil_code[i])
+        return climate, drought, pest
+    return loop
+
+
+_classify_batch_loop = _make_classify_batch_loop(range)
+
+
+# Smallest batch sent to the Numba kernel. It beats the NumPy gather
+# about 3x from ~10k rows, but importing numba (~0.2 s) and compiling
+# only pay off for very large batches; generate_report sends one row.
+_NUMBA_MIN_BATCH = 1_000_000
+
+
+@lru_cache(maxsize=None)
+def _numba_classify_batch():
+    """
+    Import numba and compile the batch loop on first use.
+    Returns None when numba (an optional dependency) is not installed.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    loop = _make_classify_batch_loop(numba.prange)
+    return numba.njit(parallel=True, cache=True)(loop)
+
+
+def _classify_batch(climate12, state_idx, month_idx, soil_code):
+    """Classify a batch with the Numba kernel if it is large, else with NumPy."""
+    if len(state_idx) >= _NUMBA_MIN_BATCH:
+        kernel = _numba_classify_batch()
+        if kernel is not None:
+            return kernel(climate12, state_idx, month_idx, soil_code)
+    return _classify_batch_numpy(climate12, state_idx, month_idx, soil_code)
+
+
 class MaizeAdvisorySystem:
     """
     Integrated decision-support system for maize cultivation.
@@ -129,74 +346,193 @@ class MaizeAdvisorySystem:
         self.soil_df = soil_df
 
         # Fixed month order for rainfall window calculations
-        self.months_order = [
-            "January", "February", "March", "April", "May", "June",
-            "July", "August", "September", "October", "November", "December"
-        ]
+        self.months_order = list(_MONTHS)
+
+        # Per-state lookup indexes, built once so each report avoids
+        # rescanning the DataFrames (month/tolerance labels are stripped
+        # because some CSV cells carry trailing spaces)
+        self._soil_levels = {
+            s: list(g["soil_level"].str.strip().str.lower())
+            for s, g in soil_df.groupby("state", observed=True)
+        }
+        self._valid_soil = {s: frozenset(v) for s, v in self._soil_levels.items()}
+        self._agro_by_state = dict(zip(state_df["state"], state_df["agro_zone"]))
+        rain = (
+            climate_df.assign(month=climate_df["month"].str.strip())
+            .pivot_table(index="state", columns="month",
+                         values="avg_rainfall_mm", aggfunc="sum")
+            .reindex(columns=self.months_order)
+            .fillna(0)
+            .astype(np.float32)
+        )
+        self._state_idx = {s: i for i, s in enumerate(rain.index)}
+
+        # 3-month rainfall totals and climate codes for every state and
+        # planting month at once: entry [i, m] covers months m..m+2 of
+        # state i (the extra all-zero last row serves states missing
+        # from the climate data)
+        r = np.vstack([rain.to_numpy(), np.zeros((1, 12), np.float32)])
+        window_rain = r + np.roll(r, -1, axis=1) + np.roll(r, -2, axis=1)
+        self._climate_code = np.digitize(window_rain, _RAINFALL_BANDS).astype(np.int8)
+
+        # Per-zone variety frames, pre-ranked by yield potential, with
+        # tolerance levels as ordered categoricals so filters compare
+        # integer codes rather than strings
+        varieties = maize_df.assign(
+            drought_tolerance=self._tolerance_levels(maize_df["drought_tolerance"]),
+            low_n_tolerance=self._tolerance_levels(maize_df["low_n_tolerance"]),
+        )
+        self._maize_by_zone = {
+            z: g.sort_values("yield_potential", ascending=False, kind="stable")
+            for z, g in varieties.groupby("adaptation_zone", observed=True)
+        }
+        self._no_varieties = varieties.iloc[:0]
+
+    @staticmethod
+    def _tolerance_levels(levels):
+        """Normalise tolerance labels into the ordered low < medium < high dtype."""
+        return levels.astype(str).str.strip().str.lower().astype(_TOLERANCE)
 
     def validate_soil_level(self, state, soil_level):
         """
         Ensure the selected soil fertility level is valid for the given state.
         Raises an error if the combination is not allowed.
         """
-        available = (
-            self.soil_df[self.soil_df["state"] == state]["soil_level"]
-            .str.lower()
-            .tolist()
-        )
-        if soil_level.lower() not in available:
+        self._validate_soil_level_lc(state, soil_level.lower(), soil_level)
+
+    def _validate_soil_level_lc(self, state, soil_lc, soil_level):
+        """validate_soil_level for an already-lowercased soil level."""
+        if soil_lc not in self._valid_soil.get(state, frozenset()):
             raise ValueError(
                 f"Soil fertility level '{soil_level}' not valid for state '{state}'. "
-                f"Available levels: {available}"
+                f"Available levels: {self._soil_levels.get(state, [])}"
             )
 
+    def climate_class(self, state, planting_month):
+        """
+        Classify climate for a state and planting month using the
+        precomputed state x planting-month climate codes.
+        """
+        i = self._state_idx.get(state, -1)
+        m = _month_index(planting_month)
+        return _CLIMATE_CLASSES[self._climate_code[i, m]]
+
     def recommend_varieties(self, agro_zone, drought_risk, soil_risk):
         """Recommend top 3 maize varieties based on risks and adaptation zone."""
-        df = self.maize_df[self.maize_df["adaptation_zone"] == agro_zone]
+        df = self._maize_by_zone.get(agro_zone, self._no_varieties)
+
+        keep = np.ones(len(df), dtype=bool)
 
         # Apply drought tolerance filtering
-        if drought_risk == "High":
-            df = df[df["drought_tolerance"].str.lower() == "high"]
-        elif drought_risk == "Medium":
-            df = df[df["drought_tolerance"].str.lower().isin(["medium", "high"])]
+        min_dt = _MIN_TOLERANCE.get(drought_risk)
+        if min_dt:
+            keep &= (df["drought_tolerance"] >= min_dt).to_numpy()
 
         # Apply low-nitrogen tolerance filtering
-        if soil_risk == "High":
-            df = df[df["low_n_tolerance"].str.lower() == "high"]
-        elif soil_risk == "Medium":
-            df = df[df["low_n_tolerance"].str.lower().isin(["medium", "high"])]
+        min_nt = _MIN_TOLERANCE.get(soil_risk)
+        if min_nt:
+            keep &= (df["low_n_tolerance"] >= min_nt).to_numpy()
 
-        # Rank by yield potential
-        return df.sort_values("yield_potential", ascending=False).head(3)
+        # Zone frames are already ranked by yield potential, so the top
+        # three are the first three matches; take them in a single copy
+        return df.iloc[np.flatnonzero(keep)[:3]]
 
-    def generate_report(self, state, planting_month, soil_level):
-        """Generate and display the complete maize advisory report """
+    def assess(self, inputs):
+        """
+        Compute zone, climate class and risk levels for a batch of
+        (state, planting_month, soil_level) requests.
+
+        Accepts a DataFrame with those columns or an iterable of tuples,
+        and returns a DataFrame with one assessment row per request.
+        """
+        return self._assess(inputs)[0]
 
-         # Validate inputs
-        self.validate_soil_level(state, soil_level)
+    def _assess(self, inputs):
+        """assess, also returning the lowercased soil level of each request."""
+        if isinstance(inputs, pd.DataFrame):
+            batch = inputs[_INPUT_COLUMNS].reset_index(drop=True)
+        else:
+            batch = pd.DataFrame(list(inputs), columns=_INPUT_COLUMNS)
+
+        # Validate inputs (soil levels are lowercased once per request)
+        soil_lc = [lv.lower() for lv in batch["soil_level"]]
+        for state, lc, soil_level in zip(batch["state"], soil_lc, batch["soil_level"]):
+            self._validate_soil_level_lc(state, lc, soil_level)
 
-        # Extract agro-ecological zone
-        agro_zone = self.state_df[self.state_df["state"] == state]["agro_zone"].iloc[0]
+        # Extract agro-ecological zones
+        batch["agro_zone"] = [self._agro_by_state[s] for s in batch["state"]]
 
-        # Risk assessments
-        climate_class = climate_class_from_rainfall(
-            self.climate_df, state, planting_month, self.months_order
+        # Risk levels as codes (0 = Low, 1 = Medium, 2 = High, -1 = Unknown),
+        # computed for the whole batch from plain NumPy arrays
+        state_idx = np.array(
+            [self._state_idx.get(s, -1) for s in batch["state"]], dtype=np.intp
+        )
+        month_idx = np.array(
+            [_month_index(m) for m in batch["planting_month"]], dtype=np.intp
         )
-        drought_risk, irrigation_note = drought_risk_from_climate(climate_class)
-        soil_risk = soil_fertility_risk(soil_level)
-        pest_risk = pest_disease_risk(drought_risk, soil_risk)
-        
+        soil_code = np.array(
+            [_SOIL_RISK_CODE.get(lc, -1) for lc in soil_lc], dtype=np.int8
+        )
+        climate_code, drought_code, pest_code = _classify_batch(
+            self._climate_code, state_idx, month_idx, soil_code
+        )
+
+        batch["climate_class"] = _LEVEL_NAMES[climate_code]
+        batch["drought_risk"] = _LEVEL_NAMES[drought_code]
+        batch["irrigation_note"] = _IRRIGATION_NOTES[climate_code]
+        batch["soil_risk"] = _LEVEL_NAMES[soil_code]
+        batch["pest_risk"] = _LEVEL_NAMES[pest_code]
+        return batch, soil_lc
+
+    def generate_reports(self, inputs, tablefmt="fancy_grid"):
+        """
+        Generate and display advisory reports for a batch of
+        (state, planting_month, soil_level) requests.
+
+        Risks are assessed for the whole batch at once and reports are
+        printed in input order, with tables in the given tabulate
+        format. Returns the assessment DataFrame.
+        """
+        assessment, soil_lc = self._assess(inputs)
+
+        # Requests sharing zone and risks share the same varieties
+        varieties = {}
+        out = []
+        for r, lc in zip(assessment.itertuples(index=False), soil_lc):
+            key = (r.agro_zone, r.drought_risk, r.soil_risk)
+            if key not in varieties:
+                varieties[key] = self.recommend_varieties(*key)
+            self._format_report(r, lc, varieties[key], out, tablefmt)
+
+        # Emit the whole batch with a single write
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
+        return assessment
+
+    def generate_report(self, state, planting_month, soil_level, tablefmt="fancy_grid"):
+        """Generate and display the complete maize advisory report """
+        self.generate_reports([(state, planting_month, soil_level)], tablefmt)
+
+    def _format_report(self, r, soil_lc, varieties, out, tablefmt):
+        """
+        Append the report lines for one assessment row (see assess) to
+        out; soil_lc is the row's already-lowercased soil level.
+        """
+        state, planting_month, soil_level = r.state, r.planting_month, r.soil_level
+        agro_zone, climate_class = r.agro_zone, r.climate_class
+        drought_risk, soil_risk, pest_risk = r.drought_risk, r.soil_risk, r.pest_risk
+        irrigation_note = r.irrigation_note
+
         # Recommendations
         pest_note = pest_disease_recommendation(pest_risk)
-        fertilizer = recommend_fertilizer(soil_level)
-        varieties = self.recommend_varieties(agro_zone, drought_risk, soil_risk)
+        fertilizer = _recommend_fertilizer_lc(soil_lc)
 
         # =========================
         # REPORT OUTPUT
         # =========================
-        print("=" * 50)
-        print("🌽 INTEGRATED MAIZE ADVISORY REPORT 🌽")
-        print("=" * 50)
+        out.append("=" * 50)
+        out.append("🌽 INTEGRATED MAIZE ADVISORY REPORT 🌽")
+        out.append("=" * 50)
 
         # Summary section
         summary = [
@@ -206,7 +542,7 @@ class MaizeAdvisorySystem:
             ["Soil fertility", soil_level],
             ["Climate class", climate_class],
         ]
-        print(tabulate(summary, tablefmt="fancy_grid"))
+        out.append(_table(summary, _SUMMARY_W, tablefmt=tablefmt))
 
         # Risk indicators
         risks = [
@@ -214,9 +550,9 @@ class MaizeAdvisorySystem:
             ["Soil fertility risk", color_risk(soil_risk)],
             ["Pest/Disease risk", color_risk(pest_risk)],
         ]
-        print("\nRISK INDICATORS")
-        print("-" * 15)
-        print(tabulate(risks, headers=["Risk", "Level"], tablefmt="fancy_grid"))
+        out.append("\nRISK INDICATORS")
+        out.append("-" * 15)
+        out.append(_table(risks, _RISK_W, ["Risk", "Level"], tablefmt))
 
          # Fertilizer recommendations
         fert_table = [
@@ -224,53 +560,91 @@ class MaizeAdvisorySystem:
             ["P2O5", fertilizer["P2O5"]],
             ["K2O", fertilizer["K2O"]],
         ]
-        print("\nFERTILIZER RECOMMENDATION (kg/ha)")
-        print("-" * 33)
-        print(tabulate(fert_table, headers=["Nutrient", "Amount"], tablefmt="fancy_grid"))
-        print(f"Notes: {fertilizer['notes']}")
+        out.append("\nFERTILIZER RECOMMENDATION (kg/ha)")
+        out.append("-" * 33)
+        out.append(_table(fert_table, _FERT_W, ["Nutrient", "Amount"], tablefmt))
+        out.append(f"Notes: {fertilizer['notes']}")
 
         # Irrigation advice
-        print("\nIRRIGATION RECOMMENDATION")
-        print("-" * 25)
-        print(irrigation_note)
+        out.append("\nIRRIGATION RECOMMENDATION")
+        out.append("-" * 25)
+        out.append(irrigation_note)
 
         # Pest and disease advice
-        print("\nPEST/DISEASE RECOMMENDATION")
-        print("-" * 28)
-        print(pest_note)
+        out.append("\nPEST/DISEASE RECOMMENDATION")
+        out.append("-" * 28)
+        out.append(pest_note)
 
         # Variety recommendations
-        print("\nRECOMMENDED MAIZE VARIETIES")
-        print("-" * 33)
+        out.append("\nRECOMMENDED MAIZE VARIETIES")
+        out.append("-" * 33)
 
         if varieties.empty:
-            print("No suitable varieties found for the selected conditions.")
+            out.append("No suitable varieties found for the selected conditions.")
         else:
-            for i, (_, row) in enumerate(varieties.iterrows(), start=1):
+            records = varieties[_VARIETY_COLUMNS].to_numpy()
+            for i, (name, mg, dt, ln, yp, gt) in enumerate(records, start=1):
                 variety_table = [
-                    ["Name", row["variety_name"]],
-                    ["Maturity group", row["maturity_group"]],
-                    ["Drought tolerance", row["drought_tolerance"]],
-                    ["Low-N tolerance", row["low_n_tolerance"]],
-                    ["Yield potential (t/ha)", row["yield_potential"]],
-                    ["Grain type", row["grain_type"]],
+                    ["Name", name],
+                    ["Maturity group", mg],
+                    ["Drought tolerance", dt],
+                    ["Low-N tolerance", ln],
+                    ["Yield potential (t/ha)", yp],
+                    ["Grain type", gt],
                 ]
-                print(f"\nVariety {i}")
-                print(tabulate(variety_table, tablefmt="fancy_grid"))
+                out.append(f"\nVariety {i}")
+                out.append(_table(variety_table, _VARIETY_W, tablefmt=tablefmt))
 
 
 # ======================================================
 # MAIN PROGRAM ENTRY POINT
 # ======================================================
 
+# Column types stored in the Parquet copies written by csv_to_parquet.py.
+# Plain CSV reads skip them: on these small files an explicit categorical
+# schema makes pd.read_csv slower, not faster.
+DATASET_SCHEMAS = {
+    "maize_varieties.csv": {
+        "drought_tolerance": "category",
+        "low_n_tolerance": "category",
+        "adaptation_zone": "category",
+        "yield_potential": "float64",  # float32 would print as 9.899999...
+    },
+    "state_profile.csv": {"state": "category", "agro_zone": "category"},
+    "climate_monthly.csv": {
+        "state": "category",
+        "month": "category",
+        "avg_rainfall_mm": "float32",
+    },
+    "soil_state.csv": {"state": "category", "soil_level": "category"},
+}
+
+
+def _parquet_path(path):
+    """Path of the Parquet copy of a dataset CSV (see csv_to_parquet.py)."""
+    return os.path.splitext(path)[0] + ".parquet"
+
+
+def _load(path):
+    """
+    Load a dataset, preferring a Parquet copy next to the CSV unless the
+    CSV has been edited since the copy was written.
+    """
+    parquet_path = _parquet_path(path)
+    if (os.path.exists(parquet_path)
+            and os.path.getmtime(parquet_path) >= os.path.getmtime(path)):
+        return pd.read_parquet(parquet_path)
+    return pd.read_csv(path)
+
+
 def main():
     """
     Load datasets, configure parameters, and run the advisory system.
     """
-    maize_df = pd.read_csv("maize_varieties.csv")
-    state_df = pd.read_csv("state_profile.csv")
-    climate_df = pd.read_csv("climate_monthly.csv")
-    soil_df = pd.read_csv("soil_state.csv")
+    maize_df = _load("maize_varieties.csv")
+    state_df = _load("state_profile.csv")
+    climate_df = _load("climate_monthly.csv")
+    soil_df = _load("soil_state.csv")
 
     SELECTED_STATE = "Kaduna"  # Nigerian state for which the advisory is generated
     PLANTING_MONTH = "July"  # Month when maize planting is assumed to start
@@ -9,17 +9,31 @@ These tests validate:
 The tests are written using pytest for clarity and simplicity.
 """
 
+import os
+
+import numpy as np
 import pandas as pd
 import pytest
 
 from project import (
     climate_class_from_rainfall,
+    classify_rainfall,
     drought_risk_from_climate,
     soil_fertility_risk,
     recommend_fertilizer,
     pest_disease_risk,
     pest_disease_recommendation,
     color_risk,
+    _classify_batch_loop,
+    _classify_batch_numpy,
+    _numba_classify_batch,
+    _display_width,
+    _load,
+    _render_kv,
+    _table,
+    _FERT_W,
+    _RISK_W,
+    _VARIETY_W,
     MaizeAdvisorySystem
 )
 
@@ -96,6 +110,13 @@ def test_climate_class_from_rainfall_medium(climate_df, months_order):
     assert result == "Medium"
 
 
+@pytest.mark.parametrize("rainfall", [-50, 0, 99.9, 100, 199.9, 200, 1000])
+def test_classify_rainfall_matches_digitize(rainfall):
+    """Scalar and matrix climate classification must share one band rule."""
+    code = int(np.digitize(rainfall, [100, 200]))
+    assert classify_rainfall(rainfall) == ["Low", "Medium", "High"][code]
+
+
 def test_drought_risk_from_climate():
     """Medium climate should imply medium drought risk."""
     risk, note = drought_risk_from_climate("Medium")
@@ -148,6 +169,54 @@ def test_color_risk_high_contains_label():
     assert "High" in colored
 
 
+@pytest.mark.parametrize("risk, expected", [
+    ("High", "\033[91m🔴 High\033[0m"),
+    ("medium", "\033[93m🟡 Medium\033[0m"),
+    ("LOW", "\033[92m🟢 Low\033[0m"),
+    ("Severe", "Unknown"),
+])
+def test_color_risk_exact_labels(risk, expected):
+    """Each level maps to its fixed ANSI color, UTF-8 emoji and reset code."""
+    assert color_risk(risk) == expected
+
+
+def test_display_width_counts_emoji_as_wide():
+    """Risk labels: ANSI codes take no columns, the emoji takes two."""
+    assert _display_width(color_risk("High")) == len("High") + 3
+    assert _display_width(color_risk("Medium")) == len("Medium") + 3
+
+
+def test_render_kv_matches_tabulate_fancy_grid():
+    """Hand-rendered tables must look exactly like tabulate's fancy_grid."""
+    tabulate = pytest.importorskip("tabulate").tabulate
+
+    risks = [
+        ["Drought risk", color_risk("High")],
+        ["Soil fertility risk", color_risk("Medium")],
+        ["Pest/Disease risk", color_risk("Low")],
+    ]
+    fert = [["N", 120], ["P2O5", 0], ["K2O", 60]]
+    variety = [
+        ["Name", "SAMMAZ 43 "],
+        ["Maturity group", "extra‑early"],
+        ["Yield potential (t/ha)", 9.9],
+    ]
+
+    assert _render_kv(risks, _RISK_W, headers=["Risk", "Level"]) == tabulate(
+        risks, headers=["Risk", "Level"], tablefmt="fancy_grid"
+    )
+    assert _render_kv(fert, _FERT_W, headers=["Nutrient", "Amount"]) == tabulate(
+        fert, headers=["Nutrient", "Amount"], tablefmt="fancy_grid"
+    )
+    assert _render_kv(variety, _VARIETY_W) == tabulate(variety, tablefmt="fancy_grid")
+
+    # Non-integer numeric columns are decimal-aligned, as tabulate does
+    rates = [["N", 1.5], ["P2O5", 10.25], ["K2O", 3]]
+    assert _table(rates, _FERT_W, ["Nutrient", "Amount"]) == tabulate(
+        rates, headers=["Nutrient", "Amount"], tablefmt="fancy_grid"
+    )
+
+
 # ======================================================
 # TESTS: MAIZE ADVISORY SYSTEM CLASS
 # ======================================================
@@ -169,7 +238,7 @@ def test_validate_soil_level_invalid_raises_error(
     system = MaizeAdvisorySystem(
         maize_df, state_df, climate_df, soil_df
     )
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match=r"\['low', 'medium', 'high'\]"):
         system.validate_soil_level("Kaduna", "Very High")
 
 
@@ -192,3 +261,122 @@ def test_recommend_varieties_returns_top_three(
 
     assert len(varieties) <= 3
     assert varieties.iloc[0]["yield_potential"] >= varieties.iloc[-1]["yield_potential"]
+
+
+def test_climate_class_uses_precomputed_index(
+    maize_df, state_df, soil_df, months_order
+):
+    """Indexed climate lookup must match the DataFrame-based classifier."""
+    climate_df = pd.DataFrame({
+        "state": ["Kaduna"] * 4,
+        "month": ["July", "August", "September ", "October"],
+        "avg_rainfall_mm": [40, 50, 60, 90]
+    })
+    system = MaizeAdvisorySystem(
+        maize_df, state_df, climate_df, soil_df
+    )
+
+    for month in months_order:
+        assert system.climate_class("Kaduna", month) == climate_class_from_rainfall(
+            climate_df, "Kaduna", month, months_order
+        )
+    assert system.climate_class("Kaduna", "August") == "High"
+
+
+def test_recommend_varieties_medium_risk_ignores_label_whitespace(
+    maize_df, state_df, climate_df, soil_df
+):
+    """Tolerance labels with stray whitespace must still pass the filters."""
+    maize_df.loc[1, "drought_tolerance"] = "medium "
+    system = MaizeAdvisorySystem(
+        maize_df, state_df, climate_df, soil_df
+    )
+
+    varieties = system.recommend_varieties(
+        "Northern Guinea Savanna",
+        drought_risk="Medium",
+        soil_risk="Medium"
+    )
+
+    assert list(varieties["variety_name"]) == ["V3", "V1", "V2"]
+
+
+def test_generate_reports_assesses_batch(
+    maize_df, state_df, climate_df, soil_df, capsys
+):
+    """Batch assessment must agree with the single-record rule functions."""
+    system = MaizeAdvisorySystem(
+        maize_df, state_df, climate_df, soil_df
+    )
+
+    assessment = system.generate_reports([
+        ("Kaduna", "July", "Low"),
+        ("Kaduna", "January", "High"),
+    ])
+
+    assert list(assessment["climate_class"]) == ["Medium", "Low"]
+    assert list(assessment["drought_risk"]) == ["Medium", "High"]
+    assert list(assessment["soil_risk"]) == ["High", "Low"]
+    assert list(assessment["pest_risk"]) == ["High", "High"]
+    assert capsys.readouterr().out.count("INTEGRATED MAIZE ADVISORY REPORT") == 2
+
+
+def test_generate_report_other_table_format(
+    maize_df, state_df, climate_df, soil_df, capsys
+):
+    """Non-default table formats should still render every section."""
+    system = MaizeAdvisorySystem(
+        maize_df, state_df, climate_df, soil_df
+    )
+    system.generate_report("Kaduna", "July", "High", tablefmt="grid")
+
+    out = capsys.readouterr().out
+    assert "+----" in out
+    assert "╒" not in out
+    assert "| Agro-ecological zone |" in out
+
+
+def test_load_ignores_parquet_older_than_csv(tmp_path):
+    """An edited CSV must win over a stale Parquet copy."""
+    csv = tmp_path / "state_profile.csv"
+    stale = tmp_path / "state_profile.parquet"
+    stale.write_bytes(b"not parquet")
+    csv.write_text("state,agro_zone\nKaduna,Northern Guinea Savanna\n")
+    os.utime(stale, (0, 0))
+
+    df = _load(str(csv))
+    assert list(df["state"]) == ["Kaduna"]
+
+
+@pytest.fixture
+def batch_codes():
+    """Random batch kernel inputs, including missing states and soil codes."""
+    rng = np.random.default_rng(0)
+    climate12 = rng.integers(0, 3, size=(5, 12)).astype(np.int8)
+    state_idx = rng.integers(-1, 5, size=500).astype(np.intp)
+    month_idx = rng.integers(0, 12, size=500).astype(np.intp)
+    soil_code = rng.integers(-1, 3, size=500).astype(np.int8)
+    assert (state_idx == -1).any() and (soil_code == -1).any()
+    return climate12, state_idx, month_idx, soil_code
+
+
+def assert_same_codes(result, expected):
+    """Batch kernels must return identical int8 code arrays."""
+    for a, b in zip(result, expected):
+        assert a.dtype == b.dtype == np.int8
+        np.testing.assert_array_equal(a, b)
+
+
+def test_classify_batch_loop_matches_numpy(batch_codes):
+    """The per-row kernel, run as plain Python, must agree with NumPy."""
+    assert_same_codes(
+        _classify_batch_loop(*batch_codes), _classify_batch_numpy(*batch_codes)
+    )
+
+
+def test_numba_classify_batch_matches_numpy(batch_codes):
+    """The compiled Numba kernel must agree with the NumPy kernel."""
+    pytest.importorskip("numba")
+    kernel = _numba_classify_batch()
+    assert kernel is not None
+    assert_same_codes(kernel(*batch_codes), _classify_batch_numpy(*batch_codes))